@@ -6,9 +6,13 @@ Implements MCP server using FastMCP framework with dynamic tool discovery
 
 import asyncio
 import json
+import logging
 import os
+import threading
+from itertools import islice
 from typing import Any, Dict, List, Optional, Union
 from googleapiclient.discovery import build
+from google_auth_httplib2 import AuthorizedHttp
 from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import InstalledAppFlow
@@ -24,6 +28,8 @@ SCOPES = [
 CREDENTIALS_FILE = "credentials.json"
 TOKEN_FILE = "token.json"
 
+logger = logging.getLogger(__name__)
+
 # Initialize FastMCP server
 mcp = FastMCP("AutoGen Event Planning Server")
 
@@ -32,97 +38,188 @@ class GoogleSheetsService:
     """Google Sheets service for MCP tools"""
     
     def __init__(self):
-        self._service = None
         self._credentials = None
-    
-    def _get_service(self):
-        """Initialize Google Sheets API service"""
-        if self._service:
-            return self._service, self._credentials
-            
-        creds = None
+        # httplib2 is not thread-safe and AutoGen runs sync tools on executor
+        # threads, so each thread gets its own transport and service objects
+        self._local = threading.local()
+        self._lock = threading.Lock()
+    
+    def _get_credentials(self) -> Credentials:
+        """Load, refresh or obtain OAuth credentials, caching them on the instance"""
+        if self._credentials and self._credentials.valid:
+            return self._credentials
         
-        # Load existing credentials
-        if os.path.exists(TOKEN_FILE):
-            try:
-                creds = Credentials.from_authorized_user_file(TOKEN_FILE, SCOPES)
-            except Exception as e:
-                print(f"⚠️  Error loading credentials: {e}")
-        
-        # Refresh or get new credentials
-        if not creds or not creds.valid:
-            if creds and creds.expired and creds.refresh_token:
+        # Only one caller loads or refreshes the token; the rest wait for it
+        with self._lock:
+            if self._credentials and self._credentials.valid:
+                return self._credentials
+            
+            creds = self._credentials
+            
+            # Load existing credentials
+            if not creds and os.path.exists(TOKEN_FILE):
                 try:
-                    creds.refresh(Request())
+                    creds = Credentials.from_authorized_user_file(TOKEN_FILE, SCOPES)
                 except Exception as e:
-                    print(f"❌ Failed to refresh credentials: {e}")
-                    creds = None
+                    logger.warning("Error loading credentials: %s", e)
             
-            if not creds:
-                if not os.path.exists(CREDENTIALS_FILE):
-                    raise FileNotFoundError(
-                        f"Google Sheets credentials file '{CREDENTIALS_FILE}' not found."
-                    )
-                
-                flow = InstalledAppFlow.from_client_secrets_file(CREDENTIALS_FILE, SCOPES)
-                creds = flow.run_local_server(port=8080, open_browser=True)
+            # Refresh or get new credentials
+            if not creds or not creds.valid:
+                if creds and creds.expired and creds.refresh_token:
+                    try:
+                        creds.refresh(Request())
+                        
+                        # Persist the refreshed token so the next start skips the refresh
+                        with open(TOKEN_FILE, "w") as token:
+                            token.write(creds.to_json())
+                    except Exception as e:
+                        logger.error("Failed to refresh credentials: %s", e)
+                        creds = None
                 
-                # Save credentials
-                with open(TOKEN_FILE, "w") as token:
-                    token.write(creds.to_json())
+                if not creds:
+                    if not os.path.exists(CREDENTIALS_FILE):
+                        raise FileNotFoundError(
+                            f"Google Sheets credentials file '{CREDENTIALS_FILE}' not found."
+                        )
+                    
+                    flow = InstalledAppFlow.from_client_secrets_file(CREDENTIALS_FILE, SCOPES)
+                    creds = flow.run_local_server(port=8080, open_browser=True)
+                    
+                    # Save credentials
+                    with open(TOKEN_FILE, "w") as token:
+                        token.write(creds.to_json())
+            
+            self._credentials = creds
+            return creds
+    
+    def _get_http(self):
+        """Authorized HTTP transport for the calling thread"""
+        # Refresh an expired token here, under the lock, before the caller executes
+        # a request; otherwise the transport would refresh it unlocked
+        creds = self._get_credentials()
         
-        self._service = build("sheets", "v4", credentials=creds)
-        self._credentials = creds
-        return self._service, self._credentials
+        # New credentials (e.g. after a fresh consent) invalidate this thread's
+        # transport and the services built on it
+        if getattr(self._local, "creds", None) is not creds:
+            self._local.creds = creds
+            self._local.http = AuthorizedHttp(creds)
+            self._local.service = None
+            self._local.drive_service = None
+        return self._local.http
     
-    def read_sheet(self, spreadsheet_id: str, range_name: str) -> List[List[str]]:
-        """Read data from Google Sheets"""
+    def _get_service(self):
+        """Initialize Google Sheets API service"""
+        http = self._get_http()
+        service = self._local.service
+        if service is None:
+            service = self._local.service = build(
+                "sheets",
+                "v4",
+                http=http,
+                static_discovery=True,
+                cache_discovery=False,
+            )
+        return service
+    
+    def _get_drive_service(self):
+        """Initialize Google Drive API service, reusing cached credentials"""
+        http = self._get_http()
+        drive_service = self._local.drive_service
+        if drive_service is None:
+            drive_service = self._local.drive_service = build(
+                "drive",
+                "v3",
+                http=http,
+                static_discovery=True,
+                cache_discovery=False,
+            )
+        return drive_service
+    
+    def read_sheet(
+        self,
+        spreadsheet_id: str,
+        range_name: str,
+        value_render_option: str = "FORMATTED_VALUE",
+    ) -> List[List[Any]]:
+        """Read data from Google Sheets
+        
+        Pass value_render_option="UNFORMATTED_VALUE" for numeric tables to get raw
+        scalars back instead of locale-formatted strings.
+        """
         try:
-            service, _ = self._get_service()
+            service = self._get_service()
             sheet = service.spreadsheets()
             result = (
                 sheet.values()
-                .get(spreadsheetId=spreadsheet_id, range=range_name)
+                .get(
+                    spreadsheetId=spreadsheet_id,
+                    range=range_name,
+                    majorDimension="ROWS",
+                    valueRenderOption=value_render_option,
+                )
                 .execute()
             )
             return result.get("values", [])
         except Exception as e:
-            print(f"Error reading Google Sheet: {str(e)}")
+            logger.error("Error reading Google Sheet: %s", e)
+            return []
+    
+    def batch_read_sheet(
+        self,
+        spreadsheet_id: str,
+        ranges: List[str],
+        value_render_option: str = "FORMATTED_VALUE",
+    ) -> List[List[List[Any]]]:
+        """Read several ranges from Google Sheets in a single request"""
+        try:
+            service = self._get_service()
+            result = (
+                service.spreadsheets()
+                .values()
+                .batchGet(
+                    spreadsheetId=spreadsheet_id,
+                    ranges=ranges,
+                    majorDimension="ROWS",
+                    valueRenderOption=value_render_option,
+                )
+                .execute()
+            )
+            return [
+                value_range.get("values", [])
+                for value_range in result.get("valueRanges", [])
+            ]
+        except Exception as e:
+            logger.error("Error batch reading Google Sheet: %s", e)
             return []
     
     def list_sheets(self) -> List[Dict[str, Any]]:
         """List all available Google Sheets"""
         try:
-            _, creds = self._get_service()
-            if not creds:
-                return []
-            
             # Use Drive API to list spreadsheets
-            from googleapiclient.discovery import build as build_drive
-            drive_service = build_drive("drive", "v3", credentials=creds)
+            drive_service = self._get_drive_service()
             
             results = (
                 drive_service.files()
                 .list(
                     q="mimeType='application/vnd.google-apps.spreadsheet'",
-                    pageSize=20,
-                    fields="files(id, name, createdTime, modifiedTime, owners)",
+                    pageSize=100,
+                    fields="files(id, name, modifiedTime, owners/emailAddress)",
                 )
                 .execute()
             )
             
             return results.get("files", [])
         except Exception as e:
-            print(f"Error listing sheets: {str(e)}")
+            logger.error("Error listing sheets: %s", e)
             return []
     
     def get_sheet_metadata(self, spreadsheet_id: str) -> Dict[str, Any]:
         """Get metadata for a specific sheet"""
         try:
-            service, _ = self._get_service()
+            service = self._get_service()
             return service.spreadsheets().get(spreadsheetId=spreadsheet_id).execute()
         except Exception as e:
-            print(f"Error getting sheet metadata: {str(e)}")
+            logger.error("Error getting sheet metadata: %s", e)
             return {}
 
 
@@ -154,38 +251,42 @@ def event_plan_event(
     Returns:
         Event planning details with optional Google Sheets data
     """
-    response = f"Event Coordinator: Planning event '{event_name}'"
+    # Nothing to plan without a name; skip the sheet read entirely
+    if not event_name.strip():
+        return "Event Coordinator: No event name provided - please specify the event to plan."
+    
+    parts = [f"Event Coordinator: Planning event '{event_name}'"]
     
     if theme:
-        response += f" with theme '{theme}'"
+        parts.append(f" with theme '{theme}'")
     if organization:
-        response += f" for {organization}"
+        parts.append(f" for {organization}")
     
-    response += "."
+    parts.append(".")
     
     if requirements:
-        response += f" Requirements: {requirements}"
+        parts.append(f" Requirements: {requirements}")
     
     # Read from Google Sheets if provided
     if google_sheet_id and sheet_range:
         try:
             sheet_data = sheets_service.read_sheet(google_sheet_id, sheet_range)
             if sheet_data:
-                response += f"\n\n📊 Google Sheets Data Retrieved ({len(sheet_data)} rows):\n"
-                for i, row in enumerate(sheet_data):
+                parts.append(f"\n\n📊 Google Sheets Data Retrieved ({len(sheet_data)} rows):\n")
+                # Header row plus the first 10 data rows
+                for i, row in enumerate(islice(sheet_data, 11)):
                     if i == 0:  # Header row
-                        response += f"Headers: {' | '.join(row)}\n"
+                        parts.append(f"Headers: {' | '.join(map(str, row))}\n")
                     else:
-                        response += f"Row {i}: {' | '.join(row)}\n"
-                    if i >= 10:  # Limit to first 10 rows
-                        response += f"... and {len(sheet_data) - 10} more rows\n"
-                        break
+                        parts.append(f"Row {i}: {' | '.join(map(str, row))}\n")
+                if len(sheet_data) > 11:
+                    parts.append(f"... and {len(sheet_data) - 11} more rows\n")
             else:
-                response += f"\n⚠️ No data found in Google Sheet range '{sheet_range}'"
+                parts.append(f"\n⚠️ No data found in Google Sheet range '{sheet_range}'")
         except Exception as e:
-            response += f"\n❌ Error reading Google Sheet: {str(e)}"
+            parts.append(f"\n❌ Error reading Google Sheet: {str(e)}")
     
-    return response
+    return "".join(parts)
 
 
 @mcp.tool()
@@ -483,23 +584,22 @@ def sheets_read_data(
         if not values:
             return "❌ No data found in the specified range"
         
-        response = f"📊 Retrieved {len(values)} rows from {range_name}\n\n"
+        parts = [f"📊 Retrieved {len(values)} rows from {range_name}\n\n"]
         
-        for i, row in enumerate(values):
+        # Limit display to the header row plus 15 data rows
+        for i, row in enumerate(islice(values, 16)):
             if i == 0:
-                response += "📋 Headers:\n"
-                response += "  " + " | ".join(f"{j+1:2d}. {cell}" for j, cell in enumerate(row)) + "\n\n"
-                response += "📄 Data:\n"
+                parts.append("📋 Headers:\n")
+                parts.append("  " + " | ".join([f"{j+1:2d}. {cell}" for j, cell in enumerate(row)]) + "\n\n")
+                parts.append("📄 Data:\n")
             else:
-                response += f"  Row {i:2d}: " + " | ".join(str(cell) for cell in row) + "\n"
-            
-            if i >= 15:  # Limit display
-                remaining = len(values) - 16
-                if remaining > 0:
-                    response += f"  ... and {remaining} more rows\n"
-                break
+                parts.append(f"  Row {i:2d}: " + " | ".join(map(str, row)) + "\n")
         
-        return response
+        remaining = len(values) - 16
+        if remaining > 0:
+            parts.append(f"  ... and {remaining} more rows\n")
+        
+        return "".join(parts)
         
     except Exception as e:
         return f"❌ Error reading spreadsheet: {str(e)}"
@@ -519,22 +619,22 @@ def sheets_list_available() -> str:
         if not files:
             return "❌ No Google Sheets found in your account"
         
-        response = f"📋 Found {len(files)} Google Sheets:\n\n"
+        parts = [f"📋 Found {len(files)} Google Sheets:\n\n"]
         
         for i, file in enumerate(files, 1):
-            response += f"{i:2d}. {file['name']}\n"
-            response += f"    ID: {file['id']}\n"
-            response += f"    URL: https://docs.google.com/spreadsheets/d/{file['id']}\n"
-            response += f"    Modified: {file.get('modifiedTime', 'Unknown')}\n"
+            parts.append(f"{i:2d}. {file['name']}\n")
+            parts.append(f"    ID: {file['id']}\n")
+            parts.append(f"    URL: https://docs.google.com/spreadsheets/d/{file['id']}\n")
+            parts.append(f"    Modified: {file.get('modifiedTime', 'Unknown')}\n")
             
             owners = file.get("owners", [])
             if owners:
                 owner_email = owners[0].get("emailAddress", "Unknown")
-                response += f"    Owner: {owner_email}\n"
+                parts.append(f"    Owner: {owner_email}\n")
             
-            response += "\n"
+            parts.append("\n")
         
-        return response
+        return "".join(parts)
         
     except Exception as e:
         return f"❌ Error listing sheets: {str(e)}"
@@ -560,11 +660,24 @@ def sheets_explore_structure(
             return "❌ Could not retrieve spreadsheet metadata"
         
         sheet_title = metadata.get("properties", {}).get("title", "Unknown")
-        response = f"🔍 Exploring: {sheet_title}\n"
-        response += f"🌐 URL: https://docs.google.com/spreadsheets/d/{spreadsheet_id}\n\n"
+        parts = [f"🔍 Exploring: {sheet_title}\n"]
+        parts.append(f"🌐 URL: https://docs.google.com/spreadsheets/d/{spreadsheet_id}\n\n")
         
         worksheets = metadata.get("sheets", [])
-        response += f"📋 Worksheets ({len(worksheets)}):\n\n"
+        parts.append(f"📋 Worksheets ({len(worksheets)}):\n\n")
+        
+        # Fetch sample data for every worksheet in one batchGet request. Titles are
+        # quoted (with embedded quotes doubled) so names like "Q1's Data" are valid
+        # A1 notation and cannot fail the whole batch
+        sample_ranges = [
+            "'" + w["properties"]["title"].replace("'", "''") + "'!A1:Z5"
+            for w in worksheets
+        ]
+        samples = (
+            sheets_service.batch_read_sheet(spreadsheet_id, sample_ranges)
+            if sample_ranges
+            else []
+        )
         
         for i, worksheet in enumerate(worksheets, 1):
             props = worksheet["properties"]
@@ -573,30 +686,25 @@ def sheets_explore_structure(
             rows = grid_props.get("rowCount", "Unknown")
             cols = grid_props.get("columnCount", "Unknown")
             
-            response += f"  {i}. {title}\n"
-            response += f"     Size: {rows} rows × {cols} columns\n"
+            parts.append(f"  {i}. {title}\n")
+            parts.append(f"     Size: {rows} rows × {cols} columns\n")
             
-            # Try to read sample data
-            try:
-                sample_range = f"{title}!A1:Z5"
-                sample_data = sheets_service.read_sheet(spreadsheet_id, sample_range)
-                if sample_data:
-                    response += f"     Sample data: {len(sample_data)} rows found\n"
-                    if len(sample_data) > 0:
-                        response += f"     Headers: {sample_data[0]}\n"
-                        if len(sample_data) > 1:
-                            response += f"     First row: {sample_data[1]}\n"
-                else:
-                    response += "     No data found\n"
-            except Exception:
-                response += "     Could not read sample data\n"
+            # A failed batch yields no samples, reported like an empty sheet as before
+            sample_data = samples[i - 1] if i <= len(samples) else []
+            if sample_data:
+                parts.append(f"     Sample data: {len(sample_data)} rows found\n")
+                parts.append(f"     Headers: {sample_data[0]}\n")
+                if len(sample_data) > 1:
+                    parts.append(f"     First row: {sample_data[1]}\n")
+            else:
+                parts.append("     No data found\n")
             
-            response += "\n"
+            parts.append("\n")
         
-        response += "💡 To read data, use sheets_read_data with specific range.\n"
-        response += "💡 Example ranges: 'Sheet1!A1:D10', 'Data!A:A', 'Sheet1' (entire sheet)"
+        parts.append("💡 To read data, use sheets_read_data with specific range.\n")
+        parts.append("💡 Example ranges: 'Sheet1!A1:D10', 'Data!A:A', 'Sheet1' (entire sheet)")
         
-        return response
+        return "".join(parts)
         
     except Exception as e:
         return f"❌ Error exploring spreadsheet: {str(e)}"
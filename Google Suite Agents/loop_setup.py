@@ -0,0 +1,15 @@
+#!/usr/bin/env python3
+"""
+Event Loop Setup
+Optional uvloop support shared by the project's entry points
+"""
+
+
+def install_uvloop():
+    """Use uvloop's faster event loop when it is installed"""
+    try:
+        import uvloop
+    except ImportError:
+        return
+
+    uvloop.install()
@@ -14,9 +14,12 @@ and share information through FastMCP tools integration.
 """
 
 import asyncio
+import functools
 import json
 import os
-from typing import List, Dict, Any
+import re
+from operator import attrgetter
+from typing import List, Dict, Any, Tuple
 
 # Third-party imports
 from dotenv import load_dotenv
@@ -29,7 +32,7 @@ from autogen_agentchat.conditions import TextMentionTermination, MaxMessageTermi
 from autogen_ext.models.openai import OpenAIChatCompletionClient
 
 # Local imports
-from fastmcp import FastMCP
+from loop_setup import install_uvloop
 
 # Load environment variables from current directory or parent directory
 if os.path.exists(".env"):
@@ -75,11 +78,15 @@ agent_configs = {
     },
 }
 
+# Fields written to output.txt for each message in the transcript
+_message_fields = attrgetter("type", "source", "content")
+
 
 async def get_tools_from_fastmcp_server() -> List[Any]:
     """Import tools directly from FastMCP server module"""
     try:
-        # Import the FastMCP server instance from fastmcp_server.py
+        # Import the FastMCP server lazily so fastmcp and the Google client
+        # libraries are only loaded when tools are actually requested
         import fastmcp_server
 
         mcp_instance = fastmcp_server.mcp
@@ -114,26 +121,29 @@ async def get_tools_from_fastmcp_server() -> List[Any]:
         return []
 
 
+@functools.lru_cache(maxsize=64)
+def _compile_domain_filter(domains: Tuple[str, ...]) -> "re.Pattern[str]":
+    """Compile allowed domains into a single regex matched against tool names"""
+    patterns = []
+    for domain in domains:
+        if domain.endswith("_"):
+            # Underscore pattern matching (e.g., "event_")
+            patterns.append(re.escape(domain) + ".*")
+        else:
+            # Exact match
+            patterns.append(re.escape(domain))
+    return re.compile("|".join(patterns))
+
+
 def filter_tools_by_domain(tools: List[Any], allowed_domains: List[str]) -> List[Any]:
     """Filter tools based on allowed domains"""
     if not allowed_domains:
         return []
 
-    filtered_tools = []
-    for tool in tools:
-        tool_name = getattr(tool, "__name__", "")
-        for domain in allowed_domains:
-            if domain.endswith("_"):
-                # Underscore pattern matching (e.g., "event_")
-                if tool_name.startswith(domain):
-                    filtered_tools.append(tool)
-                    break
-            elif domain == tool_name:
-                # Exact match
-                filtered_tools.append(tool)
-                break
-
-    return filtered_tools
+    pattern = _compile_domain_filter(tuple(allowed_domains))
+    return [
+        tool for tool in tools if pattern.fullmatch(getattr(tool, "__name__", ""))
+    ]
 
 
 async def create_agents_with_dynamic_tools():
@@ -212,18 +222,23 @@ async def main() -> None:
             )
         )
 
-        # Prepare formatted output
-        lines = []
         # If response has a 'messages' attribute, use it; otherwise, treat as a single message
         messages = getattr(response, "messages", [response])
-        for msg in messages:
-            msg_type = getattr(msg, "type", type(msg).__name__)
-            source = getattr(msg, "source", "unknown")
-            content = getattr(msg, "content", str(msg))
-            lines.append(f"---------- {msg_type} ({source}) ----------\n{content}\n\n")
+
+        # Prepare formatted output (sized up front, one entry per message)
+        lines = [None] * len(messages)
+        for i, msg in enumerate(messages):
+            try:
+                msg_type, source, content = _message_fields(msg)
+            except AttributeError:
+                # Not an AutoGen chat message; fall back field by field
+                msg_type = getattr(msg, "type", type(msg).__name__)
+                source = getattr(msg, "source", "unknown")
+                content = getattr(msg, "content", str(msg))
+            lines[i] = f"---------- {msg_type} ({source}) ----------\n{content}\n\n"
 
         with open("output.txt", "w", encoding="utf-8") as f:
-            f.writelines(lines)
+            f.write("".join(lines))
 
     finally:
         # Cleanup resources
@@ -231,4 +246,6 @@ async def main() -> None:
 
 
 if __name__ == "__main__":
+    install_uvloop()
+
     asyncio.run(main())
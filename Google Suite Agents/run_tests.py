@@ -16,6 +16,10 @@ if __name__ == "__main__":
     import run_tests as test_runner
     import asyncio
 
+    from loop_setup import install_uvloop
+
+    install_uvloop()
+
     try:
         asyncio.run(test_runner.main())
     except KeyboardInterrupt:
@@ -7,6 +7,7 @@ Handles user input, timeouts, and AutoGen integration cleanly
 import asyncio
 import sys
 import os
+import re
 from typing import Optional
 from dotenv import load_dotenv
 
@@ -16,7 +17,6 @@ from autogen_agentchat.ui import Console
 from autogen_agentchat.teams import SelectorGroupChat
 from autogen_agentchat.conditions import TextMentionTermination
 from autogen_agentchat.messages import TextMessage
-from autogen_ext.models.openai import OpenAIChatCompletionClient
 
 # Load environment variables from current directory or parent directory
 if os.path.exists(".env"):
@@ -27,6 +27,56 @@ else:
     # No .env file found, rely on system environment variables
     pass
 
+# Process-wide facts that do not change between prompts
+_IS_INTERACTIVE = sys.stdin.isatty()
+_HAS_OPENAI_KEY = bool(os.getenv("OPENAI_API_KEY"))
+
+# Canned replies for chat_simulation, matched in one regex scan
+_SIMULATED_RESPONSES = {
+    "tell me a joke": "Why don't scientists trust atoms? Because they make up everything! 😄",
+    "what is python": "Python is a high-level programming language known for its simplicity and readability.",
+    "help": "I'm here to help! You can ask me about programming, general knowledge, or anything else.",
+}
+_SIMULATED_RESPONSE_PATTERN = re.compile("|".join(map(re.escape, _SIMULATED_RESPONSES)))
+
+_MENU_PROMPT = """
+Choose an example:
+1. Basic timeout test
+2. UserProxy with timeout  
+3. Interactive AutoGen chat
+4. Exit
+
+Enter choice (1-4):"""
+
+
+async def _read_line(prompt: str) -> str:
+    """Read one line from stdin on the event loop, falling back to a worker thread"""
+    loop = asyncio.get_running_loop()
+    line_future = loop.create_future()
+
+    def on_readable():
+        if not line_future.done():
+            line_future.set_result(sys.stdin.readline())
+
+    # connect_read_pipe would flip the shared TTY to O_NONBLOCK, so watch the fd instead
+    try:
+        fd = sys.stdin.fileno()
+        loop.add_reader(fd, on_readable)
+    except (NotImplementedError, OSError, ValueError):
+        # Windows event loops and redirected pseudo-files cannot be watched
+        return await asyncio.to_thread(input, prompt)
+
+    print(prompt, end="", flush=True)
+    try:
+        line = await line_future
+    finally:
+        # Unregistering here is what makes a timeout actually abandon the read
+        loop.remove_reader(fd)
+
+    if not line:
+        raise EOFError("No input stream available")
+    return line.rstrip("\n")
+
 
 async def safe_input_with_timeout(
     prompt: str, timeout: float = 10.0, default: str = "No response"
@@ -34,23 +84,16 @@ async def safe_input_with_timeout(
     """Safe input function that handles EOF and timeout gracefully"""
     print(f"\n{prompt}")
 
-    if not sys.stdin.isatty():
+    if not _IS_INTERACTIVE:
         print(f"⚠️  Non-interactive environment - using default: '{default}'")
         return default
 
     print(f"⏰ You have {timeout} seconds to respond...")
-    input_task = None
 
     try:
-
-        def get_input():
-            try:
-                return input("👤 Your response: ")
-            except EOFError:
-                raise EOFError("No input stream available")
-
-        input_task = asyncio.get_event_loop().run_in_executor(None, get_input)
-        result = await asyncio.wait_for(input_task, timeout=timeout)
+        result = await asyncio.wait_for(
+            _read_line("👤 Your response: "), timeout=timeout
+        )
 
         if result.strip():
             print(f"✅ Input received: '{result.strip()}'")
@@ -61,18 +104,12 @@ async def safe_input_with_timeout(
 
     except asyncio.TimeoutError:
         print(f"⏰ Timeout ({timeout}s) - using default: '{default}'")
-        if input_task and not input_task.done():
-            input_task.cancel()
         return default
     except (EOFError, KeyboardInterrupt):
         print(f"⚠️  Input cancelled - using default: '{default}'")
-        if input_task and not input_task.done():
-            input_task.cancel()
         return default
     except Exception as e:
         print(f"⚠️  Error ({type(e).__name__}): {e} - using default: '{default}'")
-        if input_task and not input_task.done():
-            input_task.cancel()
         return default
 
 
@@ -100,7 +137,6 @@ async def user_proxy_test():
 
     user_proxy = UserProxyAgent(
         name="timeout_user",
-        description="User with timeout handling",
         input_func=timeout_input_func,
     )
 
@@ -133,11 +169,14 @@ async def interactive_chat_example():
     print("\n🧪 Interactive AutoGen Chat")
     print("=" * 40)
 
-    if not os.getenv("OPENAI_API_KEY"):
+    if not _HAS_OPENAI_KEY:
         print("⚠️  OPENAI_API_KEY not found - running simulation")
         await chat_simulation()
         return
 
+    # Imported here so the other examples never load the OpenAI SDK stack
+    from autogen_ext.models.openai import OpenAIChatCompletionClient
+
     model_client = OpenAIChatCompletionClient(
         model="gpt-4o",
         api_key=os.getenv("OPENAI_API_KEY"),
@@ -187,21 +226,11 @@ async def chat_simulation():
         default="Tell me a joke",
     )
 
-    responses = {
-        "tell me a joke": "Why don't scientists trust atoms? Because they make up everything! 😄",
-        "what is python": "Python is a high-level programming language known for its simplicity and readability.",
-        "help": "I'm here to help! You can ask me about programming, general knowledge, or anything else.",
-    }
-
-    user_lower = user_input.lower()
-    response = (
-        "That's an interesting question! I'd be happy to help you explore that topic."
-    )
-
-    for key, value in responses.items():
-        if key in user_lower:
-            response = value
-            break
+    match = _SIMULATED_RESPONSE_PATTERN.search(user_input.lower())
+    if match:
+        response = _SIMULATED_RESPONSES[match.group(0)]
+    else:
+        response = "That's an interesting question! I'd be happy to help you explore that topic."
 
     print(f"\n🤖 Assistant: {response}")
     print("✅ Simulation completed!")
@@ -213,18 +242,15 @@ def show_environment_info():
     print("=" * 40)
 
     checks = [
-        ("Interactive stdin", sys.stdin.isatty()),
+        ("Interactive stdin", _IS_INTERACTIVE),
         ("Interactive stdout", sys.stdout.isatty()),
-        ("TTY available", os.isatty(0)),
         ("TERM set", bool(os.environ.get("TERM"))),
-        ("OpenAI API key", bool(os.getenv("OPENAI_API_KEY"))),
+        ("OpenAI API key", _HAS_OPENAI_KEY),
     ]
 
-    for name, check in checks:
-        status = "✅" if check else "❌"
-        print(f"{status} {name}")
+    print("\n".join(f"{'✅' if check else '❌'} {name}" for name, check in checks))
 
-    if not sys.stdin.isatty():
+    if not _IS_INTERACTIVE:
         print("\n⚠️  Non-interactive environment detected")
         print("   Input functions will use default values automatically")
 
@@ -237,14 +263,7 @@ async def main():
     show_environment_info()
 
     choice = await safe_input_with_timeout(
-        """
-Choose an example:
-1. Basic timeout test
-2. UserProxy with timeout  
-3. Interactive AutoGen chat
-4. Exit
-
-Enter choice (1-4):""",
+        _MENU_PROMPT,
         timeout=10.0,
         default="1",
     )
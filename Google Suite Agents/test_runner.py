@@ -7,28 +7,36 @@ Run specific test files from the tests folder
 import sys
 import os
 import asyncio
+import importlib
+
+from loop_setup import install_uvloop
 
 # Add the tests directory to the path
 sys.path.append(os.path.join(os.path.dirname(__file__), "tests"))
 
+# Short test names mapped to their modules in the tests folder
+TESTS = {
+    "core": "test_core",
+    "auth": "test_auth",
+    "sheets": "test_sheets",
+    "mcp": "test_mcp",
+}
+
+
+def run_test(test_name, loop=None):
+    """Run a specific test file, on the given event loop if one is passed"""
+    module_name = TESTS.get(test_name)
+    if module_name is None:
+        print(f"❌ Unknown test: {test_name}")
+        print(f"Available tests: {', '.join(TESTS)}")
+        return False
 
-def run_test(test_name):
-    """Run a specific test file"""
     try:
-        if test_name == "core":
-            from test_core import main
-        elif test_name == "auth":
-            from test_auth import main
-        elif test_name == "sheets":
-            from test_sheets import main
-        elif test_name == "mcp":
-            from test_mcp import main
+        main = importlib.import_module(module_name).main
+        if loop is None:
+            asyncio.run(main())
         else:
-            print(f"❌ Unknown test: {test_name}")
-            print("Available tests: core, auth, sheets, mcp")
-            return False
-
-        asyncio.run(main())
+            loop.run_until_complete(main())
         return True
 
     except Exception as e:
@@ -38,10 +46,20 @@ def run_test(test_name):
 
 if __name__ == "__main__":
     if len(sys.argv) < 2:
-        print("Usage: python test_runner.py <test_name>")
-        print("Available tests: core, auth, sheets, mcp")
-        print("Example: python test_runner.py core")
+        print("Usage: python test_runner.py <test_name> [<test_name> ...]")
+        print(f"Available tests: {', '.join(TESTS)}")
+        print("Example: python test_runner.py core auth")
         sys.exit(1)
 
-    test_name = sys.argv[1].lower()
-    run_test(test_name)
+    install_uvloop()
+
+    # One event loop (and default executor) shared by every requested test
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    try:
+        for test_name in sys.argv[1:]:
+            run_test(test_name.lower(), loop)
+    finally:
+        loop.run_until_complete(loop.shutdown_asyncgens())
+        loop.run_until_complete(loop.shutdown_default_executor())
+        loop.close()
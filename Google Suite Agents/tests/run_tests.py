@@ -15,12 +15,20 @@ current_dir = os.path.dirname(os.path.abspath(__file__))
 parent_dir = os.path.dirname(current_dir)  # Google Suite Agents directory
 sys.path.append(parent_dir)
 
+from loop_setup import install_uvloop
+
+# Banner rule shared by the suite headers and the overall summary
+SEPARATOR = "=" * 60
+
+# Summary labels indexed by a suite's boolean result
+STATUS_LABELS = ("❌ FAIL", "✅ PASS")
+
 
 async def run_test_suite(test_file: str, test_name: str):
     """Run a specific test suite"""
-    print(f"\n{'='*60}")
+    print(f"\n{SEPARATOR}")
     print(f"🧪 Running {test_name}")
-    print(f"{'='*60}")
+    print(f"{SEPARATOR}")
 
     try:
         # Import and run the test suite
@@ -47,7 +55,7 @@ async def run_test_suite(test_file: str, test_name: str):
 async def run_all_tests():
     """Run all test suites"""
     print("🚀 Master Test Runner")
-    print("=" * 60)
+    print(SEPARATOR)
 
     test_suites = [
         ("test_core.py", "Core Test Suite"),
@@ -68,16 +76,15 @@ async def run_all_tests():
             results.append((test_name, False))
 
     # Print overall summary
-    print(f"\n{'='*60}")
+    print(f"\n{SEPARATOR}")
     print("📊 Overall Test Summary")
-    print(f"{'='*60}")
+    print(f"{SEPARATOR}")
 
-    passed = sum(1 for _, success in results if success)
+    passed = [success for _, success in results].count(True)
     total = len(results)
 
     for test_name, success in results:
-        status = "✅ PASS" if success else "❌ FAIL"
-        print(f"{status} | {test_name}")
+        print(f"{STATUS_LABELS[success]} | {test_name}")
 
     print(
         f"\n📈 Overall Success Rate: {(passed / total * 100):.1f}% ({passed}/{total})"
@@ -89,7 +96,7 @@ async def run_all_tests():
         print(f"\n⚠️  {total - passed} test suite(s) failed.")
 
 
-def show_test_menu():
+async def show_test_menu():
     """Show interactive test menu"""
     print("🧪 Test Suite Menu")
     print("=" * 40)
@@ -100,7 +107,8 @@ def show_test_menu():
     print("5. MCP client tests")
     print("6. Exit")
 
-    choice = input("\nEnter your choice (1-6): ").strip()
+    # Read on a worker thread so the event loop is not blocked while waiting
+    choice = (await asyncio.to_thread(input, "\nEnter your choice (1-6): ")).strip()
 
     if choice == "1":
         return "all"
@@ -125,13 +133,13 @@ async def main():
     print("1. Automated (run all tests)")
     print("2. Interactive (choose specific tests)")
 
-    mode = input("\nEnter mode (1-2): ").strip()
+    mode = (await asyncio.to_thread(input, "\nEnter mode (1-2): ")).strip()
 
     if mode == "1":
         await run_all_tests()
     elif mode == "2":
         while True:
-            choice = show_test_menu()
+            choice = await show_test_menu()
 
             if choice == "all":
                 await run_all_tests()
@@ -151,7 +159,11 @@ async def main():
 
             # Ask if user wants to continue
             if choice != "exit":
-                continue_test = input("\nContinue testing? (y/n): ").strip().lower()
+                continue_test = (
+                    (await asyncio.to_thread(input, "\nContinue testing? (y/n): "))
+                    .strip()
+                    .lower()
+                )
                 if continue_test != "y":
                     print("👋 Goodbye!")
                     break
@@ -160,6 +172,8 @@ async def main():
 
 
 if __name__ == "__main__":
+    install_uvloop()
+
     try:
         asyncio.run(main())
     except KeyboardInterrupt:
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Test Suite Output Helpers
+Shared output buffering for the core, auth and Google Sheets test suites
+"""
+
+import contextlib
+import contextvars
+import sys
+
+# Output buffer of the current task (one test, or a whole run); None prints directly
+_output = contextvars.ContextVar("_output", default=None)
+
+# Pass/fail outcomes of the test running in the current task, when it is buffered
+_outcomes = contextvars.ContextVar("_outcomes", default=None)
+
+
+def emit(line: str):
+    """Print a line, or add it to the current task's buffer when it has one"""
+    buffer = _output.get()
+    if buffer is None:
+        print(line)
+    else:
+        buffer.append(line)
+
+
+def record(success: bool) -> bool:
+    """Note an outcome for the running buffered test; False when there is none"""
+    outcomes = _outcomes.get()
+    if outcomes is None:
+        return False
+    outcomes.append(success)
+    return True
+
+
+async def buffered(test):
+    """Await a test with its output collected, emit it as one block and return its outcomes"""
+    buffer = []
+    outcomes = []
+    output_token = _output.set(buffer)
+    outcomes_token = _outcomes.set(outcomes)
+    try:
+        await test
+    finally:
+        _outcomes.reset(outcomes_token)
+        _output.reset(output_token)
+        emit("\n".join(buffer))
+    return outcomes
+
+
+def tally(results):
+    """Sum gathered buffered() results into (passed, failed)"""
+    # A test that raised instead of returning counts as one failure
+    passed = failed = 0
+    for outcomes in results:
+        if isinstance(outcomes, BaseException):
+            failed += 1
+            emit(f"❌ FAIL | Test aborted | {type(outcomes).__name__}: {outcomes}")
+        else:
+            ok = outcomes.count(True)
+            passed += ok
+            failed += len(outcomes) - ok
+    return passed, failed
+
+
+def success_rate(passed: int, total: int) -> float:
+    """Percentage of passed tests to one decimal place; an empty run reports 0.0"""
+    return round(passed / total * 100, 1) if total else 0.0
+
+
+@contextlib.contextmanager
+def collect_run():
+    """On a terminal print live; otherwise collect the run's output and write it once"""
+    lines = None if sys.stdout.isatty() else []
+    token = _output.set(lines)
+    try:
+        yield
+    finally:
+        _output.reset(token)
+        if lines:
+            sys.stdout.write("\n".join(lines) + "\n")
+            sys.stdout.flush()
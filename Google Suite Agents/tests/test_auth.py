@@ -9,13 +9,16 @@ import os
 import sys
 
 # Add parent directory to path to import mcp_client
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+_PARENT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _PARENT not in sys.path:
+    sys.path.insert(0, _PARENT)
 
 from google_auth_oauthlib.flow import InstalledAppFlow
 from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
 from googleapiclient.discovery import build
 from mcp_client import mcp_client
+from suite_output import collect_run, emit, success_rate
 
 # Google Sheets API configuration
 SCOPES = [
@@ -33,6 +36,12 @@ class AuthTestSuite:
         self.test_results = []
         self.passed = 0
         self.failed = 0
+        self._service = None
+        self._creds = None
+        self._drive_service = None
+        # File state is stable for a run; test_oauth_flow updates it when it rewrites the token
+        self._cred_exists = os.path.isfile(CREDENTIALS_FILE)
+        self._token_exists = os.path.isfile(TOKEN_FILE)
 
     def log_test(self, test_name: str, success: bool, message: str = ""):
         """Log test results"""
@@ -47,13 +56,32 @@ class AuthTestSuite:
         else:
             self.failed += 1
 
-        print(result)
+        emit(result)
+
+    def _service_cached(self):
+        """Return the Sheets service and credentials, building them only once"""
+        if self._service is None or self._creds is None:
+            self._service, self._creds = (
+                mcp_client._get_google_sheets_service_with_creds()
+            )
+        return self._service, self._creds
+
+    def _token_is_usable(self):
+        """Check whether token.json holds credentials that are valid or can be refreshed"""
+        if not self._token_exists:
+            return False
+        try:
+            creds = Credentials.from_authorized_user_file(TOKEN_FILE, SCOPES)
+        except Exception:
+            return False
+        # Access tokens expire after about an hour; a refresh token renews them silently
+        return creds.valid or bool(creds.expired and creds.refresh_token)
 
     def test_credentials_file(self):
         """Test if credentials file exists and is valid"""
-        print("\n🔑 Testing Credentials File...")
+        emit("\n🔑 Testing Credentials File...")
 
-        if not os.path.exists(CREDENTIALS_FILE):
+        if not self._cred_exists:
             self.log_test(
                 "Credentials File Exists", False, f"{CREDENTIALS_FILE} not found"
             )
@@ -72,9 +100,9 @@ class AuthTestSuite:
 
     def test_token_file(self):
         """Test if token file exists and is valid"""
-        print("\n🎫 Testing Token File...")
+        emit("\n🎫 Testing Token File...")
 
-        if not os.path.exists(TOKEN_FILE):
+        if not self._token_exists:
             self.log_test("Token File Exists", False, f"{TOKEN_FILE} not found")
             return False
 
@@ -102,16 +130,29 @@ class AuthTestSuite:
 
     async def test_oauth_flow(self):
         """Test OAuth flow"""
-        print("\n🔐 Testing OAuth Flow...")
+        emit("\n🔐 Testing OAuth Flow...")
 
         try:
+            # A usable token makes the interactive consent flow redundant; building
+            # the service refreshes it if it has expired
+            if os.getenv("AUTH_TEST_FORCE_OAUTH") != "1" and self._token_is_usable():
+                service, creds = self._service_cached()
+                self.log_test(
+                    "OAuth Flow (cached)",
+                    bool(service and creds),
+                    "Existing token is usable; set AUTH_TEST_FORCE_OAUTH=1 to re-run consent",
+                )
+                return bool(service and creds)
+
             # Remove existing token to force OAuth flow
-            if os.path.exists(TOKEN_FILE):
+            if self._token_exists:
                 os.remove(TOKEN_FILE)
-                print("🗑️  Removed existing token to test OAuth flow")
+                emit("🗑️  Removed existing token to test OAuth flow")
 
-            # Test OAuth flow
-            service, creds = mcp_client._get_google_sheets_service_with_creds()
+            # Drop any cached service so the OAuth flow really runs
+            self._service = self._creds = self._drive_service = None
+            service, creds = self._service_cached()
+            self._token_exists = os.path.isfile(TOKEN_FILE)
 
             if service and creds:
                 self.log_test("OAuth Flow", True, "Successfully completed OAuth flow")
@@ -126,10 +167,10 @@ class AuthTestSuite:
 
     async def test_service_creation(self):
         """Test Google Sheets service creation"""
-        print("\n🔧 Testing Service Creation...")
+        emit("\n🔧 Testing Service Creation...")
 
         try:
-            service, creds = mcp_client._get_google_sheets_service_with_creds()
+            service, creds = self._service_cached()
 
             if service and creds:
                 self.log_test(
@@ -141,12 +182,21 @@ class AuthTestSuite:
                 # Test if service can make basic API calls
                 try:
                     # Try to get user info (this should work with valid credentials)
-                    from googleapiclient.discovery import build as build_drive
-
-                    drive_service = build_drive("drive", "v3", credentials=creds)
+                    if self._drive_service is None:
+                        self._drive_service = build(
+                            "drive",
+                            "v3",
+                            credentials=creds,
+                            static_discovery=True,
+                            cache_discovery=False,
+                        )
+                    drive_service = self._drive_service
 
                     # Make a simple API call
-                    about = drive_service.about().get(fields="user").execute()
+                    # Run the blocking HTTP call off the event loop
+                    about = await asyncio.to_thread(
+                        drive_service.about().get(fields="user").execute
+                    )
                     user_info = about.get("user", {})
 
                     if user_info:
@@ -172,7 +222,7 @@ class AuthTestSuite:
 
     async def test_sheet_access(self):
         """Test access to Google Sheets"""
-        print("\n📊 Testing Sheet Access...")
+        emit("\n📊 Testing Sheet Access...")
 
         try:
             # Test with a known public sheet
@@ -219,7 +269,7 @@ class AuthTestSuite:
 
     async def test_mcp_integration(self):
         """Test MCP client authentication integration"""
-        print("\n🔗 Testing MCP Integration...")
+        emit("\n🔗 Testing MCP Integration...")
 
         try:
             # Test if MCP client can access Google Sheets
@@ -247,31 +297,37 @@ class AuthTestSuite:
 
     async def run_all_tests(self):
         """Run all authentication tests"""
-        print("🔐 Authentication Test Suite")
-        print("=" * 50)
-
-        # Run tests in order
-        self.test_credentials_file()
-        self.test_token_file()
-        await self.test_oauth_flow()
-        await self.test_service_creation()
-        await self.test_sheet_access()
-        await self.test_mcp_integration()
-
-        # Print summary
-        print("\n" + "=" * 50)
-        print("📊 Authentication Test Summary")
-        print(f"✅ Passed: {self.passed}")
-        print(f"❌ Failed: {self.failed}")
-        print(
-            f"📈 Success Rate: {(self.passed / (self.passed + self.failed) * 100):.1f}%"
-        )
-
-        if self.failed == 0:
-            print("\n🎉 All authentication tests passed!")
-        else:
-            print(f"\n⚠️  {self.failed} authentication test(s) failed.")
-            print("💡 Check the setup instructions in setup_google_sheets.py")
+        with collect_run():
+            emit("🔐 Authentication Test Suite")
+            emit("=" * 50)
+
+            # Run tests in order
+            creds_ok = self.test_credentials_file()
+            token_ok = self.test_token_file()
+
+            if creds_ok or token_ok:
+                await self.test_oauth_flow()
+                await self.test_service_creation()
+                await self.test_sheet_access()
+                await self.test_mcp_integration()
+            else:
+                # Without client secrets or a usable token every remaining test would fail on OAuth
+                for test_name in ("OAuth Flow", "Service Creation", "Sheet Access", "MCP Integration"):
+                    emit(f"⏭️  SKIP | {test_name} | No usable credentials or token")
+
+            # Print summary
+            emit("\n" + "=" * 50)
+            emit("📊 Authentication Test Summary")
+            emit(f"✅ Passed: {self.passed}")
+            emit(f"❌ Failed: {self.failed}")
+            rate = success_rate(self.passed, self.passed + self.failed)
+            emit(f"📈 Success Rate: {rate:.1f}%")
+
+            if self.failed == 0:
+                emit("\n🎉 All authentication tests passed!")
+            else:
+                emit(f"\n⚠️  {self.failed} authentication test(s) failed.")
+                emit("💡 Check the setup instructions in setup_google_sheets.py")
 
 
 def setup_instructions():
@@ -9,37 +9,81 @@ import os
 import sys
 
 # Add parent directory to path to import mcp_client
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+_PARENT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _PARENT not in sys.path:
+    sys.path.insert(0, _PARENT)
 
 from mcp_client import mcp_client
+from suite_output import buffered, emit, record, success_rate, tally
+
+# Every coordinator tool opens its reply with its role name
+EVENT_MARK = "Event Coordinator"
+FUNDRAISING_MARK = "Fundraising Coordinator"
+QUALITY_MARK = "Quality Checker"
+
+# Tool arguments used by the core tests; built once and never mutated
+EVENT_BASIC_ARGS = {
+    "event_name": "Test Event",
+    "theme": "Testing",
+    "organization": "Test Org",
+    "requirements": "Basic testing requirements",
+}
+EVENT_SHEETS_ARGS = {
+    "event_name": "Test Event with Sheets",
+    "theme": "Testing",
+    "organization": "Test Org",
+    "google_sheet_id": "1bWMM3u-Y2b_5zfIetLLvkreZ6iOVvvaX",
+    "sheet_range": "Sheet1!A1:E19",
+}
+FUNDRAISING_ARGS = {
+    "goal": "Test Fundraising Goal",
+    "event_name": "Test Event",
+    "budget_target": 5000,
+}
+QUALITY_ARGS = {
+    "item": "Test Item",
+    "category": "Testing",
+    "criteria": "Basic quality criteria",
+}
+
+# Line prefixes written by log_test
+_PASS = "✅ PASS | "
+_FAIL = "❌ FAIL | "
+
+# Caps concurrent tool calls so the gathered tests cannot flood the MCP server
+_call_slots = asyncio.Semaphore(int(os.environ.get("MCP_TEST_CONCURRENCY", "6")))
 
 
 class CoreTestSuite:
     """Main test suite for all functionality"""
 
     def __init__(self):
-        self.test_results = []
         self.passed = 0
         self.failed = 0
 
     def log_test(self, test_name: str, success: bool, message: str = ""):
         """Log test results"""
-        status = "✅ PASS" if success else "❌ FAIL"
-        result = f"{status} | {test_name}"
+        result = (_PASS if success else _FAIL) + test_name
         if message:
-            result += f" | {message}"
+            result += " | " + message
 
-        self.test_results.append(result)
-        if success:
-            self.passed += 1
-        else:
-            self.failed += 1
+        # Outcomes of buffered tests are folded into the counters by run_all_tests
+        if not record(success):
+            if success:
+                self.passed += 1
+            else:
+                self.failed += 1
 
-        print(result)
+        emit(result)
+
+    async def _call_tool(self, tool_name: str, arguments: dict):
+        """Call an MCP tool once a concurrency slot is free"""
+        async with _call_slots:
+            return await mcp_client.call_tool(tool_name, arguments)
 
     async def test_authentication(self):
         """Test Google Sheets authentication"""
-        print("\n🔐 Testing Authentication...")
+        emit("\n🔐 Testing Authentication...")
 
         try:
             # Test if credentials file exists
@@ -79,11 +123,15 @@ class CoreTestSuite:
 
     async def test_mcp_tools(self):
         """Test MCP tool functionality"""
-        print("\n🛠️  Testing MCP Tools...")
+        emit("\n🛠️  Testing MCP Tools...")
 
         try:
+            # Discovery and function creation are independent, so overlap them
+            tools, tool_functions = await asyncio.gather(
+                mcp_client.get_tools(), mcp_client.create_tool_functions(["*"])
+            )
+
             # Test tool discovery
-            tools = await mcp_client.get_tools()
             if tools:
                 self.log_test("Tool Discovery", True, f"Found {len(tools)} tools")
             else:
@@ -100,14 +148,16 @@ class CoreTestSuite:
                 "sheets.select_sheet",
             ]
 
-            for tool_name in expected_tools:
-                if tool_name in tools:
-                    self.log_test(f"Tool: {tool_name}", True)
-                else:
-                    self.log_test(f"Tool: {tool_name}", False, "Tool not found")
+            missing = [name for name in expected_tools if name not in tools]
+            self.log_test(
+                "Expected Tools",
+                not missing,
+                f"missing: {', '.join(missing)}"
+                if missing
+                else f"all {len(expected_tools)} present",
+            )
 
             # Test tool function creation
-            tool_functions = await mcp_client.create_tool_functions(["*"])
             if tool_functions:
                 self.log_test(
                     "Tool Function Creation",
@@ -125,62 +175,48 @@ class CoreTestSuite:
 
     async def test_event_planning(self):
         """Test event planning functionality"""
-        print("\n📅 Testing Event Planning...")
+        emit("\n📅 Testing Event Planning...")
 
         try:
-            # Test basic event planning
-            result = await mcp_client.call_tool(
-                "event.plan_event",
-                {
-                    "event_name": "Test Event",
-                    "theme": "Testing",
-                    "organization": "Test Org",
-                    "requirements": "Basic testing requirements",
-                },
+            # Both planning calls are independent, so issue them together
+            basic_result, sheets_result = await asyncio.gather(
+                self._call_tool("event.plan_event", EVENT_BASIC_ARGS),
+                self._call_tool("event.plan_event", EVENT_SHEETS_ARGS),
+                return_exceptions=True,
             )
 
-            if result and "Event Coordinator" in result:
+            # Test basic event planning
+            if isinstance(basic_result, Exception):
+                raise basic_result
+            if basic_result and basic_result.startswith(EVENT_MARK):
                 self.log_test("Basic Event Planning", True, "Event planning successful")
             else:
                 self.log_test("Basic Event Planning", False, "Event planning failed")
 
             # Test event planning with Google Sheets (if available)
-            try:
-                result = await mcp_client.call_tool(
-                    "event.plan_event",
-                    {
-                        "event_name": "Test Event with Sheets",
-                        "theme": "Testing",
-                        "organization": "Test Org",
-                        "google_sheet_id": "1bWMM3u-Y2b_5zfIetLLvkreZ6iOVvvaX",
-                        "sheet_range": "Sheet1!A1:E19",
-                    },
-                )
-
-                if result:
-                    if "📊 Google Sheets Data Retrieved" in result:
-                        self.log_test(
-                            "Event Planning with Sheets",
-                            True,
-                            "Successfully read sheet data",
-                        )
-                    elif "❌ Error reading Google Sheet" in result:
-                        self.log_test(
-                            "Event Planning with Sheets", False, "Sheet access error"
-                        )
-                    else:
-                        self.log_test(
-                            "Event Planning with Sheets",
-                            True,
-                            "Event planned without sheet data",
-                        )
+            if isinstance(sheets_result, Exception):
+                self.log_test("Event Planning with Sheets", False, f"Error: {sheets_result}")
+            elif sheets_result:
+                if "📊 Google Sheets Data Retrieved" in sheets_result:
+                    self.log_test(
+                        "Event Planning with Sheets",
+                        True,
+                        "Successfully read sheet data",
+                    )
+                elif "❌ Error reading Google Sheet" in sheets_result:
+                    self.log_test(
+                        "Event Planning with Sheets", False, "Sheet access error"
+                    )
                 else:
                     self.log_test(
-                        "Event Planning with Sheets", False, "No result returned"
+                        "Event Planning with Sheets",
+                        True,
+                        "Event planned without sheet data",
                     )
-
-            except Exception as e:
-                self.log_test("Event Planning with Sheets", False, f"Error: {e}")
+            else:
+                self.log_test(
+                    "Event Planning with Sheets", False, "No result returned"
+                )
 
             return True
 
@@ -190,19 +226,12 @@ class CoreTestSuite:
 
     async def test_fundraising(self):
         """Test fundraising functionality"""
-        print("\n💰 Testing Fundraising...")
+        emit("\n💰 Testing Fundraising...")
 
         try:
-            result = await mcp_client.call_tool(
-                "fundraising.create_plan",
-                {
-                    "goal": "Test Fundraising Goal",
-                    "event_name": "Test Event",
-                    "budget_target": 5000,
-                },
-            )
+            result = await self._call_tool("fundraising.create_plan", FUNDRAISING_ARGS)
 
-            if result and "Fundraising Coordinator" in result:
+            if result and result.startswith(FUNDRAISING_MARK):
                 self.log_test(
                     "Fundraising Planning", True, "Fundraising planning successful"
                 )
@@ -219,19 +248,12 @@ class CoreTestSuite:
 
     async def test_quality_check(self):
         """Test quality check functionality"""
-        print("\n✅ Testing Quality Checks...")
+        emit("\n✅ Testing Quality Checks...")
 
         try:
-            result = await mcp_client.call_tool(
-                "quality.check_deliverable",
-                {
-                    "item": "Test Item",
-                    "category": "Testing",
-                    "criteria": "Basic quality criteria",
-                },
-            )
+            result = await self._call_tool("quality.check_deliverable", QUALITY_ARGS)
 
-            if result and "Quality Checker" in result:
+            if result and result.startswith(QUALITY_MARK):
                 self.log_test("Quality Check", True, "Quality check successful")
             else:
                 self.log_test("Quality Check", False, "Quality check failed")
@@ -244,11 +266,12 @@ class CoreTestSuite:
 
     async def test_sheet_selector(self):
         """Test sheet selector functionality"""
-        print("\n📊 Testing Sheet Selector...")
+        emit("\n📊 Testing Sheet Selector...")
 
         try:
             # Test listing sheets
-            result = await mcp_client.sheets_select_sheet("", "")
+            async with _call_slots:
+                result = await mcp_client.sheets_select_sheet("", "")
 
             if result and "📋 Found" in result:
                 self.log_test("Sheet Listing", True, "Successfully listed sheets")
@@ -269,30 +292,38 @@ class CoreTestSuite:
 
     async def run_all_tests(self):
         """Run all tests"""
-        print("🧪 Core Test Suite")
-        print("=" * 50)
+        emit("🧪 Core Test Suite")
+        emit("=" * 50)
 
-        # Run tests in order
+        # Authentication and tool discovery gate everything else
         await self.test_authentication()
-        await self.test_mcp_tools()
-        await self.test_event_planning()
-        await self.test_fundraising()
-        await self.test_quality_check()
-        await self.test_sheet_selector()
+        if await self.test_mcp_tools():
+            # The tool-call tests are independent, so overlap their round trips
+            results = await asyncio.gather(
+                buffered(self.test_event_planning()),
+                buffered(self.test_fundraising()),
+                buffered(self.test_quality_check()),
+                buffered(self.test_sheet_selector()),
+                return_exceptions=True,
+            )
+            passed, failed = tally(results)
+            self.passed += passed
+            self.failed += failed
+        else:
+            emit("\n⏭️  Skipping tool tests: no MCP tools available")
 
         # Print summary
-        print("\n" + "=" * 50)
-        print("📊 Test Summary")
-        print(f"✅ Passed: {self.passed}")
-        print(f"❌ Failed: {self.failed}")
-        print(
-            f"📈 Success Rate: {(self.passed / (self.passed + self.failed) * 100):.1f}%"
-        )
+        emit("\n" + "=" * 50)
+        emit("📊 Test Summary")
+        emit(f"✅ Passed: {self.passed}")
+        emit(f"❌ Failed: {self.failed}")
+        rate = success_rate(self.passed, self.passed + self.failed)
+        emit(f"📈 Success Rate: {rate:.1f}%")
 
         if self.failed == 0:
-            print("\n🎉 All tests passed!")
+            emit("\n🎉 All tests passed!")
         else:
-            print(f"\n⚠️  {self.failed} test(s) failed. Check the results above.")
+            emit(f"\n⚠️  {self.failed} test(s) failed. Check the results above.")
 
 
 async def main():
@@ -9,11 +9,31 @@ import os
 import sys
 
 # Add parent directory to path to import fastmcp_server
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+_PARENT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _PARENT not in sys.path:
+    sys.path.insert(0, _PARENT)
 
 # Import FastMCP server
 import fastmcp_server
 
+# Tool name prefixes checked by test_domain_filtering, with display labels
+TOOL_DOMAINS = {
+    "event_": "Event",
+    "fundraising_": "Fundraising",
+    "quality_": "Quality",
+    "sheets_": "Sheets",
+}
+
+_tools_task = None
+
+
+async def _get_tools():
+    """Fetch the server's tool registry once per event loop and share it across tests"""
+    global _tools_task
+    if _tools_task is None or _tools_task.get_loop() is not asyncio.get_running_loop():
+        _tools_task = asyncio.ensure_future(fastmcp_server.mcp.get_tools())
+    return await _tools_task
+
 
 async def test_fastmcp_server_initialization():
     """Test FastMCP server initialization"""
@@ -38,7 +58,7 @@ async def test_tool_discovery():
 
     try:
         # Get tools from the FastMCP server
-        tools_dict = await fastmcp_server.mcp.get_tools()
+        tools_dict = await _get_tools()
 
         if tools_dict and len(tools_dict) > 0:
             print(f"✅ Tool discovery successful - Found {len(tools_dict)} tools")
@@ -62,7 +82,7 @@ async def test_tool_calling():
 
     try:
         # Get tools from the server
-        tools_dict = await fastmcp_server.mcp.get_tools()
+        tools_dict = await _get_tools()
 
         # Find an event planning tool to test
         event_tools = [name for name in tools_dict.keys() if name.startswith("event_")]
@@ -95,33 +115,20 @@ async def test_domain_filtering():
 
     try:
         # Get all tools from the server
-        tools_dict = await fastmcp_server.mcp.get_tools()
+        tools_dict = await _get_tools()
 
-        # Count tools by domain
-        event_tools = [name for name in tools_dict.keys() if name.startswith("event_")]
-        fundraising_tools = [
-            name for name in tools_dict.keys() if name.startswith("fundraising_")
-        ]
-        quality_tools = [
-            name for name in tools_dict.keys() if name.startswith("quality_")
-        ]
-        sheets_tools = [
-            name for name in tools_dict.keys() if name.startswith("sheets_")
-        ]
+        # Count tools by domain in a single pass over the registry
+        domain_counts = dict.fromkeys(TOOL_DOMAINS, 0)
+        for name in tools_dict:
+            prefix = name.partition("_")[0] + "_"
+            if prefix in domain_counts:
+                domain_counts[prefix] += 1
 
         domains_found = 0
-        if event_tools:
-            print(f"   Event tools: {len(event_tools)}")
-            domains_found += 1
-        if fundraising_tools:
-            print(f"   Fundraising tools: {len(fundraising_tools)}")
-            domains_found += 1
-        if quality_tools:
-            print(f"   Quality tools: {len(quality_tools)}")
-            domains_found += 1
-        if sheets_tools:
-            print(f"   Sheets tools: {len(sheets_tools)}")
-            domains_found += 1
+        for prefix, label in TOOL_DOMAINS.items():
+            if domain_counts[prefix]:
+                print(f"   {label} tools: {domain_counts[prefix]}")
+                domains_found += 1
 
         if domains_found >= 2:  # At least 2 different domains
             print(
@@ -143,7 +150,7 @@ async def test_server_integration():
 
     try:
         # Test that we can get tools the same way main.py does
-        tools_dict = await fastmcp_server.mcp.get_tools()
+        tools_dict = await _get_tools()
 
         # Convert to list of callable functions like main.py does
         tools_list = []
@@ -176,7 +183,7 @@ async def test_error_handling():
 
     try:
         # Test accessing non-existent tools gracefully
-        tools_dict = await fastmcp_server.mcp.get_tools()
+        tools_dict = await _get_tools()
 
         # This should work without errors
         non_existent = tools_dict.get("non_existent_tool", None)
@@ -196,36 +203,30 @@ async def test_error_handling():
         return True
 
 
+# Tests 2-6, run by main() after the initialization check
+REGISTRY_TESTS = (
+    ("Tool Discovery", test_tool_discovery),
+    ("Tool Calling", test_tool_calling),
+    ("Domain Filtering", test_domain_filtering),
+    ("Server Integration", test_server_integration),
+    ("Error Handling", test_error_handling),
+)
+
+
 async def main():
     """Main FastMCP Test Suite"""
     print("🧪 FastMCP Server Test Suite")
     print("=" * 50)
 
-    test_results = []
-
     # Test 1: Server Initialization
-    result = await test_fastmcp_server_initialization()
-    test_results.append(("FastMCP Server Initialization", result))
-
-    # Test 2: Tool Discovery
-    result = await test_tool_discovery()
-    test_results.append(("Tool Discovery", result))
-
-    # Test 3: Tool Calling
-    result = await test_tool_calling()
-    test_results.append(("Tool Calling", result))
-
-    # Test 4: Domain Filtering
-    result = await test_domain_filtering()
-    test_results.append(("Domain Filtering", result))
-
-    # Test 5: Server Integration
-    result = await test_server_integration()
-    test_results.append(("Server Integration", result))
-
-    # Test 6: Error Handling
-    result = await test_error_handling()
-    test_results.append(("Error Handling", result))
+    init_result = await test_fastmcp_server_initialization()
+
+    # Tests 2-6 run in order so each header stays with its output; the tool
+    # registry they read is fetched once by _get_tools, so there is no I/O to overlap
+    test_results = [
+        ("FastMCP Server Initialization", init_result),
+        *[(test_name, await test()) for test_name, test in REGISTRY_TESTS],
+    ]
 
     # Print results summary
     print(f"\n{'='*50}")
@@ -5,50 +5,106 @@ Comprehensive testing of Google Sheets functionality
 """
 
 import asyncio
+import contextlib
 import os
+import re
 import sys
 
 # Add parent directory to path to import mcp_client
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+_PARENT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _PARENT not in sys.path:
+    sys.path.insert(0, _PARENT)
 
-from mcp_client import mcp_client
+from suite_output import buffered, collect_run, emit, record, success_rate, tally
+
+_mcp_client = None
+
+
+def _client():
+    """Import mcp_client on first use, so importing this module stays cheap"""
+    global _mcp_client
+    if _mcp_client is None:
+        from mcp_client import mcp_client
+
+        _mcp_client = mcp_client
+    return _mcp_client
+
+
+# Sheet count reported by the listing tool
+_FOUND_RE = re.compile(r"Found (\d+) Google Sheets")
+
+# Markers that sheets_select_sheet reported the failure instead of returning data;
+# an unknown worksheet may also come back as an empty range
+_INVALID_ID_MARKERS = ("❌ Error", "Error reading data")
+_INVALID_RANGE_MARKERS = ("❌ Error", "No data found")
+
+# Section markers the sheet tools write; one scan finds every marker present
+_SECTION_MARKERS = (
+    "🔍 Exploring:",
+    "📋 Worksheets",
+    "📊 Retrieved",
+    "📋 Headers:",
+    "📄 Data:",
+)
+_MARKER_RE = re.compile("|".join(map(re.escape, _SECTION_MARKERS)))
 
 
 class SheetsTestSuite:
     """Google Sheets test suite"""
 
+    # Google's public sample spreadsheet, readable by any account
+    SAMPLE_SHEET_ID = "1BxiMVs0XRA5nFMdKvBdBZjgmUUqptlbs74OgvE2upms"
+
+    # Ranges read by test_range_formats, with the label each is logged under
+    RANGE_CASES = (
+        ("Class Data!A1:D5", "Specific range"),
+        ("Class Data!A:A", "Entire column"),
+        ("Class Data!1:1", "Entire row"),
+        ("Class Data", "Entire sheet"),
+    )
+
     def __init__(self):
-        self.test_results = []
         self.passed = 0
         self.failed = 0
+        # sheets_select_sheet tasks keyed by (sheet_id, range); concurrent tests share them
+        self._select_tasks = {}
 
     def log_test(self, test_name: str, success: bool, message: str = ""):
         """Log test results"""
         status = "✅ PASS" if success else "❌ FAIL"
-        result = f"{status} | {test_name}"
-        if message:
-            result += f" | {message}"
+        parts = (status, test_name, message) if message else (status, test_name)
+        result = " | ".join(parts)
 
-        self.test_results.append(result)
-        if success:
-            self.passed += 1
-        else:
-            self.failed += 1
+        # Outcomes of buffered tests are folded into the counters by run_all_tests
+        if not record(success):
+            if success:
+                self.passed += 1
+            else:
+                self.failed += 1
 
-        print(result)
+        emit(result)
+
+    async def _select_sheet(self, sheet_id: str, range_name: str) -> str:
+        """sheets_select_sheet, fetched at most once per sheet and range in a run"""
+        key = (sheet_id, range_name)
+        task = self._select_tasks.get(key)
+        if task is None:
+            task = asyncio.ensure_future(
+                _client().sheets_select_sheet(sheet_id, range_name)
+            )
+            self._select_tasks[key] = task
+        return await task
 
     async def test_sheet_listing(self):
         """Test listing all available sheets"""
-        print("\n📋 Testing Sheet Listing...")
+        emit("\n📋 Testing Sheet Listing...")
 
         try:
-            result = await mcp_client.sheets_select_sheet("", "")
+            result = await self._select_sheet("", "")
 
             if result and "📋 Found" in result:
                 # Extract number of sheets found
-                import re
-
-                match = re.search(r"Found (\d+) Google Sheets", result)
+                match = _FOUND_RE.search(result)
                 if match:
                     sheet_count = int(match.group(1))
                     self.log_test("Sheet Listing", True, f"Found {sheet_count} sheets")
@@ -71,14 +127,16 @@ class SheetsTestSuite:
 
     async def test_public_sheet_access(self):
         """Test access to public Google Sheets"""
-        print("\n🌐 Testing Public Sheet Access...")
+        emit("\n🌐 Testing Public Sheet Access...")
 
         try:
             # Test with Google's public sample sheet
-            sample_sheet_id = "1BxiMVs0XRA5nFMdKvBdBZjgmUUqptlbs74OgvE2upms"
             sample_range = "Class Data!A1:E10"
 
-            result = mcp_client._read_google_sheet(sample_sheet_id, sample_range)
+            # Synchronous read; run it off the loop so the other tests keep going
+            result = await asyncio.to_thread(
+                _client()._read_google_sheet, self.SAMPLE_SHEET_ID, sample_range
+            )
 
             if result and len(result) > 0:
                 self.log_test(
@@ -107,21 +165,20 @@ class SheetsTestSuite:
 
     async def test_sheet_exploration(self):
         """Test sheet exploration functionality"""
-        print("\n🔍 Testing Sheet Exploration...")
+        emit("\n🔍 Testing Sheet Exploration...")
 
         try:
             # Test with Google's public sample sheet
-            sample_sheet_id = "1BxiMVs0XRA5nFMdKvBdBZjgmUUqptlbs74OgvE2upms"
-
-            result = await mcp_client.sheets_select_sheet(sample_sheet_id, "")
+            result = await self._select_sheet(self.SAMPLE_SHEET_ID, "")
+            found = set(_MARKER_RE.findall(result or ""))
 
-            if result and "🔍 Exploring:" in result:
+            if "🔍 Exploring:" in found:
                 self.log_test(
                     "Sheet Exploration", True, "Successfully explored sheet structure"
                 )
 
                 # Check if worksheets are listed
-                if "📋 Worksheets" in result:
+                if "📋 Worksheets" in found:
                     self.log_test(
                         "Worksheet Discovery",
                         True,
@@ -140,20 +197,20 @@ class SheetsTestSuite:
 
     async def test_data_reading(self):
         """Test reading specific data from sheets"""
-        print("\n📊 Testing Data Reading...")
+        emit("\n📊 Testing Data Reading...")
 
         try:
             # Test with Google's public sample sheet
-            sample_sheet_id = "1BxiMVs0XRA5nFMdKvBdBZjgmUUqptlbs74OgvE2upms"
             sample_range = "Class Data!A1:D5"
 
-            result = await mcp_client.sheets_select_sheet(sample_sheet_id, sample_range)
+            result = await self._select_sheet(self.SAMPLE_SHEET_ID, sample_range)
+            found = set(_MARKER_RE.findall(result or ""))
 
-            if result and "📊 Retrieved" in result:
+            if "📊 Retrieved" in found:
                 self.log_test("Data Reading", True, "Successfully read sheet data")
 
                 # Check if headers and data are displayed
-                if "📋 Headers:" in result and "📄 Data:" in result:
+                if "📋 Headers:" in found and "📄 Data:" in found:
                     self.log_test(
                         "Data Formatting", True, "Data properly formatted with headers"
                     )
@@ -172,39 +229,34 @@ class SheetsTestSuite:
 
     async def test_range_formats(self):
         """Test different range formats"""
-        print("\n📏 Testing Range Formats...")
+        emit("\n📏 Testing Range Formats...")
 
         try:
-            sample_sheet_id = "1BxiMVs0XRA5nFMdKvBdBZjgmUUqptlbs74OgvE2upms"
-
-            # Test different range formats
-            test_ranges = [
-                ("Class Data!A1:D5", "Specific range"),
-                ("Class Data!A:A", "Entire column"),
-                ("Class Data!1:1", "Entire row"),
-                ("Class Data", "Entire sheet"),
-            ]
-
-            for range_name, description in test_ranges:
-                try:
-                    result = await mcp_client.sheets_select_sheet(
-                        sample_sheet_id, range_name
+            # The ranges are read independently, so request them together
+            results = await asyncio.gather(
+                *(
+                    self._select_sheet(self.SAMPLE_SHEET_ID, range_name)
+                    for range_name, _ in self.RANGE_CASES
+                ),
+                return_exceptions=True,
+            )
+
+            for (range_name, description), result in zip(self.RANGE_CASES, results):
+                if isinstance(result, Exception):
+                    self.log_test(
+                        f"Range: {description}", False, f"Error with {range_name}: {result}"
                     )
-                    if result and "📊 Retrieved" in result:
-                        self.log_test(
-                            f"Range: {description}",
-                            True,
-                            f"Successfully read {range_name}",
-                        )
-                    else:
-                        self.log_test(
-                            f"Range: {description}",
-                            False,
-                            f"Failed to read {range_name}",
-                        )
-                except Exception as e:
+                elif result and "📊 Retrieved" in result:
+                    self.log_test(
+                        f"Range: {description}",
+                        True,
+                        f"Successfully read {range_name}",
+                    )
+                else:
                     self.log_test(
-                        f"Range: {description}", False, f"Error with {range_name}: {e}"
+                        f"Range: {description}",
+                        False,
+                        f"Failed to read {range_name}",
                     )
 
             return True
@@ -215,17 +267,17 @@ class SheetsTestSuite:
 
     async def test_error_handling(self):
         """Test error handling for invalid sheets/ranges"""
-        print("\n⚠️  Testing Error Handling...")
+        emit("\n⚠️  Testing Error Handling...")
 
         try:
             # Test with invalid sheet ID
             invalid_sheet_id = "invalid_sheet_id_12345"
 
-            result = await mcp_client.sheets_select_sheet(
+            result = await self._select_sheet(
                 invalid_sheet_id, "Sheet1!A1:D5"
             )
 
-            if result and ("❌ Error" in result or "Error reading data" in result):
+            if result and any(marker in result for marker in _INVALID_ID_MARKERS):
                 self.log_test(
                     "Invalid Sheet ID", True, "Properly handled invalid sheet ID"
                 )
@@ -237,14 +289,13 @@ class SheetsTestSuite:
                 )
 
             # Test with invalid range
-            sample_sheet_id = "1BxiMVs0XRA5nFMdKvBdBZjgmUUqptlbs74OgvE2upms"
             invalid_range = "InvalidSheet!A1:D5"
 
-            result = await mcp_client.sheets_select_sheet(
-                sample_sheet_id, invalid_range
+            result = await self._select_sheet(
+                self.SAMPLE_SHEET_ID, invalid_range
             )
 
-            if result and ("❌ Error" in result or "No data found" in result):
+            if result and any(marker in result for marker in _INVALID_RANGE_MARKERS):
                 self.log_test("Invalid Range", True, "Properly handled invalid range")
             else:
                 self.log_test(
@@ -259,17 +310,17 @@ class SheetsTestSuite:
 
     async def test_mcp_integration(self):
         """Test MCP integration with Google Sheets"""
-        print("\n🔗 Testing MCP Integration...")
+        emit("\n🔗 Testing MCP Integration...")
 
         try:
             # Test event planning with Google Sheets
-            result = await mcp_client.call_tool(
+            result = await _client().call_tool(
                 "event.plan_event",
                 {
                     "event_name": "Test Event with Sheets",
                     "theme": "Testing",
                     "organization": "Test Org",
-                    "google_sheet_id": "1BxiMVs0XRA5nFMdKvBdBZjgmUUqptlbs74OgvE2upms",
+                    "google_sheet_id": self.SAMPLE_SHEET_ID,
                     "sheet_range": "Class Data!A1:E5",
                 },
             )
@@ -302,86 +353,118 @@ class SheetsTestSuite:
 
     async def run_all_tests(self):
         """Run all Google Sheets tests"""
-        print("📊 Google Sheets Test Suite")
-        print("=" * 50)
-
-        # Run tests in order
-        await self.test_sheet_listing()
-        await self.test_public_sheet_access()
-        await self.test_sheet_exploration()
-        await self.test_data_reading()
-        await self.test_range_formats()
-        await self.test_error_handling()
-        await self.test_mcp_integration()
-
-        # Print summary
-        print("\n" + "=" * 50)
-        print("📊 Google Sheets Test Summary")
-        print(f"✅ Passed: {self.passed}")
-        print(f"❌ Failed: {self.failed}")
-        print(
-            f"📈 Success Rate: {(self.passed / (self.passed + self.failed) * 100):.1f}%"
-        )
-
-        if self.failed == 0:
-            print("\n🎉 All Google Sheets tests passed!")
-        else:
-            print(f"\n⚠️  {self.failed} Google Sheets test(s) failed.")
+        with collect_run():
+            emit("📊 Google Sheets Test Suite")
+            emit("=" * 50)
+
+            # Load (and refresh if needed) the OAuth token once up front, so the
+            # concurrent tests start with warm credentials instead of racing for them
+            try:
+                await asyncio.to_thread(_client()._get_google_sheets_service_with_creds)
+            except Exception as e:
+                emit(f"⚠️  Could not pre-load Google credentials: {e}")
+
+            # The tests share no state, so overlap their API calls; each test's
+            # output is buffered and kept together as one block
+            results = await asyncio.gather(
+                buffered(self.test_sheet_listing()),
+                buffered(self.test_public_sheet_access()),
+                buffered(self.test_sheet_exploration()),
+                buffered(self.test_data_reading()),
+                buffered(self.test_range_formats()),
+                buffered(self.test_error_handling()),
+                buffered(self.test_mcp_integration()),
+                return_exceptions=True,
+            )
 
+            # Fold every test's outcomes into the counters once all have finished
+            passed, failed = tally(results)
+            self.passed += passed
+            self.failed += failed
+
+            # Print summary
+            emit("\n" + "=" * 50)
+            emit("📊 Google Sheets Test Summary")
+            emit(f"✅ Passed: {self.passed}")
+            emit(f"❌ Failed: {self.failed}")
+            rate = success_rate(self.passed, self.passed + self.failed)
+            emit(f"📈 Success Rate: {rate:.1f}%")
+
+            if self.failed == 0:
+                emit("\n🎉 All Google Sheets tests passed!")
+            else:
+                emit(f"\n⚠️  {self.failed} Google Sheets test(s) failed.")
 
 async def interactive_sheet_test():
     """Interactive sheet testing"""
     print("🎯 Interactive Google Sheets Testing")
     print("=" * 40)
 
-    while True:
-        print("\nOptions:")
-        print("1. List all my sheets")
-        print("2. Explore a specific sheet")
-        print("3. Read data from a sheet")
-        print("4. Test with public sample sheet")
-        print("5. Exit")
-
-        choice = input("\nEnter your choice (1-5): ").strip()
-
-        if choice == "1":
-            print("\n📋 Listing all sheets...")
-            result = await mcp_client.sheets_select_sheet("", "")
-            print(result)
-
-        elif choice == "2":
-            sheet_id = input("Enter sheet ID: ").strip()
-            if sheet_id:
-                print(f"\n🔍 Exploring sheet {sheet_id}...")
-                result = await mcp_client.sheets_select_sheet(sheet_id, "")
-                print(result)
-            else:
-                print("❌ Please enter a valid sheet ID")
-
-        elif choice == "3":
-            sheet_id = input("Enter sheet ID: ").strip()
-            range_name = input("Enter range (e.g., Sheet1!A1:D10): ").strip()
-            if sheet_id and range_name:
-                print(f"\n📊 Reading data from {sheet_id}, range {range_name}...")
-                result = await mcp_client.sheets_select_sheet(sheet_id, range_name)
+    # Sheet listing fetched once, while the user first reads the menu, so the
+    # first choice of option 1 is instant; later choices fetch a fresh listing
+    listing = asyncio.ensure_future(_client().sheets_select_sheet("", ""))
+
+    try:
+        while True:
+            print("\nOptions:")
+            print("1. List all my sheets")
+            print("2. Explore a specific sheet")
+            print("3. Read data from a sheet")
+            print("4. Test with public sample sheet")
+            print("5. Exit")
+
+            choice = (await asyncio.to_thread(input, "\nEnter your choice (1-5): ")).strip()
+
+            if choice == "1":
+                print("\n📋 Listing all sheets...")
+                if listing is not None:
+                    result = await listing
+                    listing = None
+                else:
+                    result = await _client().sheets_select_sheet("", "")
                 print(result)
-            else:
-                print("❌ Please enter both sheet ID and range")
 
-        elif choice == "4":
-            print("\n🌐 Testing with Google's public sample sheet...")
-            sample_sheet_id = "1BxiMVs0XRA5nFMdKvBdBZjgmUUqptlbs74OgvE2upms"
-            result = await mcp_client.sheets_select_sheet(
-                sample_sheet_id, "Class Data!A1:E5"
-            )
-            print(result)
+            elif choice == "2":
+                sheet_id = (await asyncio.to_thread(input, "Enter sheet ID: ")).strip()
+                if sheet_id:
+                    print(f"\n🔍 Exploring sheet {sheet_id}...")
+                    result = await _client().sheets_select_sheet(sheet_id, "")
+                    print(result)
+                else:
+                    print("❌ Please enter a valid sheet ID")
+
+            elif choice == "3":
+                sheet_id = (await asyncio.to_thread(input, "Enter sheet ID: ")).strip()
+                range_name = (
+                    await asyncio.to_thread(input, "Enter range (e.g., Sheet1!A1:D10): ")
+                ).strip()
+                if sheet_id and range_name:
+                    print(f"\n📊 Reading data from {sheet_id}, range {range_name}...")
+                    result = await _client().sheets_select_sheet(sheet_id, range_name)
+                    print(result)
+                else:
+                    print("❌ Please enter both sheet ID and range")
 
-        elif choice == "5":
-            print("👋 Goodbye!")
-            break
+            elif choice == "4":
+                print("\n🌐 Testing with Google's public sample sheet...")
+                result = await _client().sheets_select_sheet(
+                    SheetsTestSuite.SAMPLE_SHEET_ID, "Class Data!A1:E5"
+                )
+                print(result)
 
-        else:
-            print("❌ Invalid choice. Please enter 1-5.")
+            elif choice == "5":
+                print("👋 Goodbye!")
+                break
+
+            else:
+                print("❌ Invalid choice. Please enter 1-5.")
+    finally:
+        if listing is not None:
+            listing.cancel()
+            # Retrieve the outcome so an unused, failed prefetch is not logged
+            # as "Task exception was never retrieved"
+            with contextlib.suppress(asyncio.CancelledError, Exception):
+                await listing
 
 
 async def main():
@@ -390,7 +473,7 @@ async def main():
     print("1. Run automated tests")
     print("2. Interactive testing")
 
-    choice = input("\nEnter choice (1-2): ").strip()
+    choice = (await asyncio.to_thread(input, "\nEnter choice (1-2): ")).strip()
 
     if choice == "1":
         test_suite = SheetsTestSuite()